@@ -0,0 +1,238 @@
+# =============================================================================
+# Created By: Shaun Altmann
+# =============================================================================
+'''
+Rubik's Cube Model Kernels Module
+-
+Contains compiled (Numba) functions for the hot paths of the Rubik's Cube
+Model, operating directly on the `Cube` colour / permutation arrays.
+
+Notes:
+- Each kernel is compiled eagerly from its explicit signature with
+    `cache=True`, so the compiled machine code is reused by later processes
+    instead of being compiled on the first call.
+'''
+# =============================================================================
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# used for compiling the kernels
+from numba import (
+    boolean,
+    int8,
+    int32,
+    int64,
+    njit,
+    types,
+)
+
+# used for array creation
+import numpy as np
+
+# used for the colour of faces that are not visible
+from ._src import (
+    COLOURS,
+)
+
+
+# =============================================================================
+# Constant Definitions
+# =============================================================================
+
+# compile-time constant colour ID of faces that are not visible
+_BLANK: int = COLOURS.CUBE.BLANK
+
+# read-only 1D array types of the movement codes, which also accept writeable
+#  arrays (e.g. the read-only compiled `MOVES` formulae)
+_CODES_INT8: types.Array = types.Array(int8, 1, 'C', readonly=True)
+_CODES_INT64: types.Array = types.Array(int64, 1, 'C', readonly=True)
+
+# read-only array types of the `Cube` move tables, which are shared between
+#  cubes (see `Cube.clone()`)
+_PERM: types.Array = types.Array(int32, 1, 'C', readonly=True)
+_PERMS: types.Array = types.Array(int32, 2, 'C', readonly=True)
+
+
+# =============================================================================
+# Kernels
+# =============================================================================
+
+# =================
+# Apply Permutation
+@njit(int8[:, ::1](int8[:, ::1], _PERM), cache=True)
+def apply_perm(colours, perm):
+    '''
+    Apply Permutation
+    -
+    Gathers the flattened `colours` array through the given permutation, such
+    that `output.reshape(-1)[i] = colours.reshape(-1)[perm[i]]`.
+
+    Parameters
+    -
+    - colours : `np.ndarray`
+        - `(P, 6)` C-contiguous `int8` array of piece colours.
+    - perm : `np.ndarray`
+        - `(P*6,)` C-contiguous `int32` array of flattened source indexes.
+
+    Returns
+    -
+    - `np.ndarray`
+        - New `(P, 6)` array of the permuted piece colours.
+    '''
+
+    out = np.empty_like(colours)
+    flat_in = colours.reshape(-1)
+    flat_out = out.reshape(-1)
+    for i in range(flat_in.size):
+        flat_out[i] = flat_in[perm[i]]
+    return out
+
+# ==================
+# Apply Permutations
+@njit(int8[:, ::1](int8[:, ::1], _PERMS, _CODES_INT8), cache=True)
+def apply_perms(colours, perms, codes):
+    '''
+    Apply Permutations
+    -
+    Gathers the flattened `colours` array through each of the permutations
+    indexed by `codes` in turn (see `apply_perm()`).
+
+    Parameters
+    -
+    - colours : `np.ndarray`
+        - `(P, 6)` C-contiguous `int8` array of piece colours.
+    - perms : `np.ndarray`
+        - `(M, P*6)` C-contiguous `int32` array of the permutation of each
+            movement code.
+    - codes : `np.ndarray`
+        - C-contiguous `int8` array of the movement codes to apply, each in
+            the range `[0, M)`.
+
+    Returns
+    -
+    - `np.ndarray`
+        - New `(P, 6)` array of the permuted piece colours.
+    '''
+
+    out = colours.copy()
+    buf = np.empty_like(colours)
+    flat_out = out.reshape(-1)
+    flat_buf = buf.reshape(-1)
+    for code in codes:
+        perm = perms[code]
+        for i in range(flat_out.size):
+            flat_buf[i] = flat_out[perm[i]]
+        flat_out[:] = flat_buf
+    return out
+
+# =======================
+# Apply Piece State Moves
+@njit(
+    types.UniTuple(int64, 4)(
+        int64, int64, int64, int64,
+        int8[:, :, ::1], int8[:, :, ::1], _CODES_INT64
+    ),
+    cache=True
+)
+def apply_state_moves(cp, co, ep, eo, corners, edges, codes):
+    '''
+    Apply Piece State Moves
+    -
+    Applies each of the face turns indexed by `codes` to the packed
+    `Cube3State` words, only rewriting the corner / edge lanes moved by each
+    turn. No face turns are applied if any code is out of range.
+
+    Parameters
+    -
+    - cp : `int`
+        - Corner permutation, 4 bits per corner position.
+    - co : `int`
+        - Corner orientations, 2 bits per corner position.
+    - ep : `int`
+        - Edge permutation, 4 bits per edge position.
+    - eo : `int`
+        - Edge orientations, 1 bit per edge position.
+    - corners : `np.ndarray`
+        - `(M, 4, 3)` C-contiguous `int8` array of the source position,
+            destination position and orientation change of each corner moved
+            by each face turn.
+    - edges : `np.ndarray`
+        - `(M, 4, 3)` C-contiguous `int8` array of the source position,
+            destination position and orientation change of each edge moved by
+            each face turn.
+    - codes : `np.ndarray`
+        - C-contiguous `int64` array of the face turns to apply, each in the
+            range `[0, M)`.
+
+    Returns
+    -
+    - `tuple[int, int, int, int]`
+        - New `cp`, `co`, `ep` and `eo` words, or all `-1` if any code is out
+            of range.
+    '''
+
+    for code in codes:
+        if (code < 0) or (code >= corners.shape[0]):
+            return -1, -1, -1, -1
+    for code in codes:
+        new_cp = cp
+        new_co = co
+        for lane in range(corners.shape[1]):
+            src = np.int64(corners[code, lane, 0])
+            dest = np.int64(corners[code, lane, 1])
+            twist = np.int64(corners[code, lane, 2])
+            new_cp = (new_cp & ~(np.int64(0xF) << (4*dest))) \
+                | (((cp >> (4*src)) & 0xF) << (4*dest))
+            new_co = (new_co & ~(np.int64(0x3) << (2*dest))) \
+                | (((((co >> (2*src)) & 0x3) + twist) % 3) << (2*dest))
+        new_ep = ep
+        new_eo = eo
+        for lane in range(edges.shape[1]):
+            src = np.int64(edges[code, lane, 0])
+            dest = np.int64(edges[code, lane, 1])
+            flip = np.int64(edges[code, lane, 2])
+            new_ep = (new_ep & ~(np.int64(0xF) << (4*dest))) \
+                | (((ep >> (4*src)) & 0xF) << (4*dest))
+            new_eo = (new_eo & ~(np.int64(0x1) << dest)) \
+                | ((((eo >> src) & 0x1) ^ flip) << dest)
+        cp, co, ep, eo = new_cp, new_co, new_ep, new_eo
+    return cp, co, ep, eo
+
+# =========
+# Is Solved
+@njit(boolean(int8[:, ::1]), cache=True)
+def is_solved(colours):
+    '''
+    Is Solved
+    -
+    Checks whether every face of the cube is a single colour, ignoring any
+    faces of pieces which are not visible (`COLOURS.CUBE.BLANK`).
+
+    Parameters
+    -
+    - colours : `np.ndarray`
+        - `(P, 6)` C-contiguous `int8` array of piece colours.
+
+    Returns
+    -
+    - `bool`
+        - Whether or not each face only contains a single colour.
+    '''
+
+    for face in range(colours.shape[1]):
+        face_colour = _BLANK
+        for pce in range(colours.shape[0]):
+            col = colours[pce, face]
+            if col == _BLANK: continue
+            if face_colour == _BLANK:
+                face_colour = col
+            elif col != face_colour:
+                return False
+    return True
+
+
+# =============================================================================
+# End of File
+# =============================================================================
@@ -13,20 +13,30 @@ Rubik's Cube Model.
 # Imports
 # =============================================================================
 
+# used for compiled movement sequences
+import numpy as np
+
+# used for rotating `Cube_Piece` colours
+from operator import (
+    itemgetter,
+)
+
 # used for type hinting
 from typing import (
     Any,
+    Callable,
+    Final,
 )
 
 
 # =============================================================================
 # Type Definitions
 # =============================================================================
-_COLOUR = tuple[int, str] | None
+_COLOUR = int
 _COLOUR_PIECE_CUBE = tuple[
-    tuple[_COLOUR, _COLOUR], # X Positive, X Negative
-    tuple[_COLOUR, _COLOUR], # Y Positive, Y Negative
-    tuple[_COLOUR, _COLOUR], # Z Positive, Z Negative
+    _COLOUR, _COLOUR, # X Positive, X Negative
+    _COLOUR, _COLOUR, # Y Positive, Y Negative
+    _COLOUR, _COLOUR, # Z Positive, Z Negative
 ]
 _DATA = dict[str, Any]
 _POS = tuple[float, float, float]
@@ -46,13 +56,91 @@ class COLOURS():
     class CUBE():
         ''' Cube Colour Definitions. '''
 
-        B = (2, 'B')
-        G = (3, 'G')
-        O = (4, 'O')
-        R = (1, 'R')
-        W = (0, 'W')
-        Y = (5, 'Y')
-        ALL = [B, G, O, R, W, Y]
+        B: Final[int] = 2
+        G: Final[int] = 3
+        O: Final[int] = 4
+        R: Final[int] = 1
+        W: Final[int] = 0
+        Y: Final[int] = 5
+        BLANK: Final[int] = 6
+        ''' Colour ID of a face that is not visible. '''
+        ALL: Final[list[int]] = [B, G, O, R, W, Y]
+        CHAR: Final[tuple[str, ...]] = ('W', 'R', 'B', 'G', 'O', 'Y', ' ')
+        ''' Colour character of each colour, indexed by colour ID. '''
+
+# ====================
+# Rotation Definitions
+AXIS_PERM: Final[dict[str, tuple[list[int], list[int]]]] = {
+    'x': ([0, 2, 1], [1, -1, 1]), # (x, y, z) -> (x, -z, y)
+    'y': ([2, 1, 0], [1, 1, -1]), # (x, y, z) -> (z, y, -x)
+    'z': ([1, 0, 2], [-1, 1, 1]), # (x, y, z) -> (-y, x, z)
+}
+'''
+Position permutation of a single positive rotation around each axis, as
+`(axis order, axis sign)`, such that the rotated position is
+`pos[axis order] * axis sign`.
+'''
+FACE_PERM: Final[dict[str, list[int]]] = {
+    'x': [0, 1, 5, 4, 2, 3], # +y -> +z
+    'y': [4, 5, 2, 3, 1, 0], # +z -> +x
+    'z': [3, 2, 0, 1, 4, 5], # +x -> +y
+}
+'''
+Face (colour column) permutation of a single positive rotation around each
+axis, such that the rotated colours are `colours[face perm]`.
+'''
+DIRECTION_AXIS: Final[dict[str, tuple[int, str]]] = {
+    **{char: (0, 'x') for char in 'xlLrR'},
+    **{char: (1, 'y') for char in 'ydDuU'},
+    **{char: (2, 'z') for char in 'zbBfF'},
+}
+''' Axis `(index, name)` rotated around, by the first character of a move. '''
+DIRECTION_NEGATIVE: Final[frozenset[str]] = frozenset('fFrRuU')
+'''
+First characters of moves turning the positive side of an axis, which is a
+negative rotation when turned clockwise.
+'''
+DIRECTION_TURNS: Final[dict[str, int]] = {'\'': 3, '2': 2}
+'''
+Number of clockwise quarter turns of a move by its last character, `1` if
+not listed.
+'''
+ROT_POS: Final[dict[str, Callable[[_POS], _POS]]] = {
+    'x': lambda pos: (pos[0], -1*pos[2], pos[1]),
+    'y': lambda pos: (pos[2], pos[1], -1*pos[0]),
+    'z': lambda pos: (-1*pos[1], pos[0], pos[2]),
+}
+''' `Cube_Piece` position of a single positive rotation around each axis. '''
+ROT_COL: Final[
+    dict[str, Callable[[_COLOUR_PIECE_CUBE], _COLOUR_PIECE_CUBE]]
+] = {
+    axis: itemgetter(*perm) for axis, perm in FACE_PERM.items()
+}
+''' `Cube_Piece` colours of a single positive rotation around each axis. '''
+
+# ==============
+# Movement Codes
+MOVE_NAMES: Final[tuple[str, ...]] = tuple(
+    [
+        f'{face}{suffix}'
+        for suffix in ['', '\'', '2']
+        for face in ['R', 'U', 'F', 'L', 'D', 'B']
+    ] + [
+        f'{axis}{suffix}'
+        for suffix in ['', '\'', '2']
+        for axis in ['x', 'y', 'z']
+    ]
+)
+'''
+Direction (see `Cube.rotate()`) of each movement code. Codes 0-17 are the face
+turns (`face + 6*suffix`), codes 18-26 are the whole cube rotations
+(`18 + axis + 3*suffix`).
+'''
+MOVE_CODES: Final[dict[str, int]] = {
+    name: code
+    for code, name in enumerate(MOVE_NAMES)
+}
+''' Movement code of each direction in `MOVE_NAMES`. '''
 
 # ====================
 # Movement Definitions
@@ -301,6 +389,288 @@ class MOVES():
                 | &larr; | &darr; | #      |
                 '''
 
+# ===========================
+# Compiled Movement Sequences
+ALG_TABLE: Final[dict[tuple[str, ...], np.ndarray]] = {}
+'''
+Compiled movement sequence (see `_compile_alg()`) of every formula in `MOVES`,
+keyed by the attribute path of the formula within `MOVES` (e.g.
+`("C3", "F2", "CT_ET_WS", "CB_EBB")`).
+'''
+
+
+# =============================================================================
+# Function Definitions
+# =============================================================================
+
+# =========================
+# Compile Movement Sequence
+def _compile_alg(alg: str) -> np.ndarray:
+    '''
+    Compile Movement Sequence
+    -
+    Compiles a movement sequence string (e.g. `"(R U R') (U' R U R')"`) into
+    an array of movement codes (see `MOVE_NAMES`). Brackets are ignored, and
+    3x3x3 wide turns (e.g. `"d"`, `"f'"`) are compiled into the equivalent
+    whole cube rotation + opposite face turn. Consecutive movements of the same
+    face / axis are fused (see `COMPOSE`), e.g. `"R R"` -> `"R2"`, and
+    `"R R'"` is removed.
+
+    Parameters
+    -
+    - alg : `str`
+        - Space-separated movement sequence.
+
+    Returns
+    -
+    - `np.ndarray`
+        - `int8` array of the movement codes.
+    '''
+
+    codes: list[int] = []
+    for move in alg.replace('(', ' ').replace(')', ' ').split():
+        # wide turns
+        if (move[0] in ['b', 'd', 'f', 'l', 'r', 'u']) \
+                and (move[1:] in ['', '\'', '2']):
+            suffix: str = move[1:]
+            axis, opposite, negative = {
+                'b': ('z', 'F', True),
+                'd': ('y', 'U', True),
+                'f': ('z', 'B', False),
+                'l': ('x', 'R', True),
+                'r': ('x', 'L', False),
+                'u': ('y', 'D', False),
+            }[move[0]]
+            rotation: str = suffix if negative else {
+                '': '\'',
+                '\'': '',
+                '2': '2',
+            }[suffix]
+            _push_move(codes, MOVE_CODES[f'{axis}{rotation}'])
+            _push_move(codes, MOVE_CODES[f'{opposite}{suffix}'])
+            continue
+
+        if move not in MOVE_CODES:
+            raise ValueError(
+                f'_compile_alg(): move must be one of {list(MOVE_CODES)} or a '
+                + f'wide turn, got {move}.'
+            )
+        _push_move(codes, MOVE_CODES[move])
+
+    return np.array(codes, dtype=np.int8)
+
+# ==========================
+# Compile Movement Constants
+def _compile_moves(
+        cls: type,
+        path: tuple[str, ...] = ()
+) -> None:
+    '''
+    Compile Movement Constants
+    -
+    Recursively adds a compiled `<NAME>_C` attribute (see `_compile_alg()`)
+    alongside every movement sequence string attribute of the given class and
+    its nested classes, and adds each compiled sequence to `ALG_TABLE`. The
+    compiled sequences are read-only.
+
+    Parameters
+    -
+    - cls : `type`
+        - Class containing the movement sequence strings (e.g. `MOVES`).
+    - path : `tuple[str, ...]`
+        - Attribute path of `cls` within `MOVES`, used as the `ALG_TABLE` key
+            prefix.
+
+    Returns
+    -
+    None
+    '''
+
+    for name, val in list(vars(cls).items()):
+        if name.startswith('_'): continue
+        if isinstance(val, type):
+            _compile_moves(val, path + (name,))
+        elif isinstance(val, str):
+            # read-only, since every cube applying the formula shares it
+            codes: np.ndarray = _compile_alg(val)
+            codes.flags.writeable = False
+            setattr(cls, f'{name}_C', codes)
+            ALG_TABLE[path + (name,)] = codes
+
+# ================
+# Compose Rotation
+def _compose_rotation(
+        axis: str,
+        num_rotations: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    '''
+    Compose Rotation
+    -
+    Composes the position and face permutations of `num_rotations` positive
+    rotations around the given axis (see `AXIS_PERM` and `FACE_PERM`) into a
+    single permutation.
+
+    Parameters
+    -
+    - axis : `str`
+        - Axis to rotate around, one of `"x"`, `"y"` or `"z"`.
+    - num_rotations : `int`
+        - Number of positive rotations around the axis.
+
+    Returns
+    -
+    - `tuple[np.ndarray, np.ndarray, np.ndarray]`
+        - Axis order of the rotated position.
+        - Axis sign of the rotated position.
+        - Face permutation of the rotated colours.
+    '''
+
+    axis_order: np.ndarray = np.arange(3)
+    axis_sign: np.ndarray = np.ones(3, dtype=np.int8)
+    face_perm: np.ndarray = np.arange(6)
+    for _ in range(num_rotations):
+        axis_sign = axis_sign[AXIS_PERM[axis][0]] * AXIS_PERM[axis][1]
+        axis_order = axis_order[AXIS_PERM[axis][0]]
+        face_perm = face_perm[FACE_PERM[axis]]
+    return axis_order, axis_sign, face_perm
+
+# ===========
+# Format List
+def _fmt_list(val: list[Any]) -> str:
+    '''
+    Format List
+    -
+    Formats a list for `OBJ.__repr__()` with one item per line.
+
+    Parameters
+    -
+    - val : `list[Any]`
+        - List to format.
+
+    Returns
+    -
+    - `str`
+        - String representation of the list.
+    '''
+
+    return '[' + (',\n\t\t'.join(str(sub_val) for sub_val in val)) + ']'
+
+# ============
+# Format Array
+def _fmt_ndarray(val: np.ndarray) -> str:
+    '''
+    Format Array
+    -
+    Formats an array for `OBJ.__repr__()` by its shape and type only, rather
+    than every element.
+
+    Parameters
+    -
+    - val : `np.ndarray`
+        - Array to format.
+
+    Returns
+    -
+    - `str`
+        - String representation of the array.
+    '''
+
+    return f'ndarray(shape={val.shape}, dtype={val.dtype})'
+
+# ==============
+# Fuse Movements
+def _fuse_moves(move_1: str, move_2: str) -> int:
+    '''
+    Fuse Movements
+    -
+    Calculates the single movement equivalent to applying `move_1` then
+    `move_2`.
+
+    Parameters
+    -
+    - move_1 : `str`
+        - First direction in `MOVE_NAMES`.
+    - move_2 : `str`
+        - Second direction in `MOVE_NAMES`.
+
+    Returns
+    -
+    - `int`
+        - Movement code of the equivalent movement, `-1` if the movements
+            cancel out, or `-2` if they cannot be fused (different face /
+            axis).
+    '''
+
+    if move_1[0] != move_2[0]: return -2
+    turns: dict[str, int] = {'': 1, '\'': 3, '2': 2}
+    total: int = (turns[move_1[1:]] + turns[move_2[1:]]) % 4
+    if total == 0: return -1
+    return MOVE_CODES[move_1[0] + {1: '', 2: '2', 3: '\''}[total]]
+
+# =============
+# Push Movement
+def _push_move(codes: list[int], code: int) -> None:
+    '''
+    Push Movement
+    -
+    Appends the movement code to the end of the compiled movement sequence,
+    fusing it with the last movement of the sequence where possible (see
+    `COMPOSE`).
+
+    Parameters
+    -
+    - codes : `list[int]`
+        - Compiled movement sequence, modified in place.
+    - code : `int`
+        - Movement code to append.
+
+    Returns
+    -
+    None
+    '''
+
+    if codes:
+        fused: int = int(COMPOSE[codes[-1], code])
+        if fused == -1:
+            codes.pop()
+            return
+        if fused >= 0:
+            codes[-1] = fused
+            return
+    codes.append(code)
+
+# movement composition table - `COMPOSE[a, b]` is the movement code equal to
+#  applying movement code `a` then `b`, `-1` for no movement, or `-2` if the
+#  movements cannot be fused
+COMPOSE: Final[np.ndarray] = np.array(
+    [
+        [_fuse_moves(move_1, move_2) for move_2 in MOVE_NAMES]
+        for move_1 in MOVE_NAMES
+    ],
+    dtype=np.int8
+)
+COMPOSE.flags.writeable = False
+
+# compile all of the pre-defined movements
+_compile_moves(MOVES)
+
+# position (`(axis order, axis sign)`) and face permutations of 1 to 3
+#  positive rotations around each axis, keyed by `(axis, num_rotations)`
+POS_PERM: Final[dict[tuple[str, int], tuple[np.ndarray, np.ndarray]]] = {}
+COL_PERM: Final[dict[tuple[str, int], np.ndarray]] = {}
+for _axis in FACE_PERM:
+    for _num_rotations in range(1, 4):
+        _order, _sign, _face = _compose_rotation(_axis, _num_rotations)
+        POS_PERM[(_axis, _num_rotations)] = (_order, _sign)
+        COL_PERM[(_axis, _num_rotations)] = _face
+del _axis, _num_rotations, _order, _sign, _face
+
+# `OBJ.__repr__()` value formatter of each type, `str()` if not listed
+_FMT: Final[dict[type, Callable[[Any], str]]] = {
+    list: _fmt_list,
+    np.ndarray: _fmt_ndarray,
+}
+
 
 # =============================================================================
 # Generic Object Definition
@@ -313,15 +683,53 @@ class OBJ(object):
 
     Attributes
     -
-    None
+    - _repr_cache : `str | None`
+        - Cached long representation, `None` until `repr()` is next called.
+    - _str_cache : `str | None`
+        - Cached short representation, `None` until `str()` is next called.
 
     Methods
     -
+    - _clear_cache() : `None`
+        - Instance Method.
+        - Clears the cached representations of the object.
     - _get_data(short=False) : `_DATA`
         - Instance Method.
         - Gets all data from the current instance of the object.
     '''
 
+    __slots__ = (
+        '_repr_cache',
+        '_str_cache',
+    )
+
+    # ===========
+    # Constructor
+    def __init__(self) -> None:
+        self._repr_cache: str | None = None
+        self._str_cache: str | None = None
+
+    # ===========
+    # Clear Cache
+    def _clear_cache(self) -> None:
+        '''
+        Clear Cache
+        -
+        Clears the cached long / short representations of the object. Must be
+        called whenever the data returned by `_get_data()` changes.
+
+        Parameters
+        -
+        None
+
+        Returns
+        -
+        None
+        '''
+
+        self._repr_cache = None
+        self._str_cache = None
+
     # ========
     # Get Data
     def _get_data(
@@ -367,19 +775,17 @@ class OBJ(object):
             - Long string representation of the current instance of the object.
         '''
 
+        if self._repr_cache is not None: return self._repr_cache
+
         cls_name: str = self.__class__.__name__
-        output: str = f'<{cls_name}>'
+        parts: list[str] = [f'<{cls_name}>']
         for key, val in self._get_data().items():
-            val_str: str = str(val)
-            if isinstance(val, list):
-                val_str = (
-                    '[' \
-                    + (',\n\t\t'.join([str(sub_val) for sub_val in val])) \
-                    + ']'
-                )
-            output += f'\n\t{key} = {val_str}'
-
-        return output + f'\n</{cls_name}>'
+            val_str: str = _FMT.get(type(val), str)(val)
+            parts.append(f'\n\t{key} = {val_str}')
+        parts.append(f'\n</{cls_name}>')
+
+        self._repr_cache = ''.join(parts)
+        return self._repr_cache
     
     # ====================
     # Short Representation
@@ -401,7 +807,9 @@ class OBJ(object):
                 object.
         '''
 
-        output: str = (
+        if self._str_cache is not None: return self._str_cache
+
+        self._str_cache = (
             f'<{self.__class__.__name__}' \
             + (
                 ', '.join([
@@ -413,7 +821,7 @@ class OBJ(object):
             + ' />'
         )
 
-        return output
+        return self._str_cache
 
 
 # =============================================================================
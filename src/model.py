@@ -22,18 +22,41 @@ Notes:
 # Imports
 # =============================================================================
 
+# used for the compiled hot paths
+from ._kernels import (
+    apply_perm,
+    apply_perms,
+    apply_state_moves,
+    is_solved,
+)
+
 # used for generic object
 from ._src import (
     _COLOUR,
     _COLOUR_PIECE_CUBE,
     _DATA,
     _POS,
+    _compile_alg,
+    COL_PERM,
     COLOURS,
+    DIRECTION_AXIS,
+    DIRECTION_NEGATIVE,
+    DIRECTION_TURNS,
+    MOVE_CODES,
+    MOVE_NAMES,
     OBJ,
+    POS_PERM,
+    ROT_COL,
+    ROT_POS,
+)
+
+# used for caching the move directions of each cube size
+from functools import (
+    lru_cache,
 )
 
-# used for creating copies of objects
-from copy import deepcopy
+# used for storing the cube state
+import numpy as np
 
 # used for type hinting
 from typing import (
@@ -55,12 +78,27 @@ class Cube(OBJ):
 
     Attributes
     -
+    - colours : `np.ndarray`
+        - `(P, 6)` array of colour IDs for each visible piece, with the
+            columns ordered X positive, X negative, Y positive, Y negative,
+            Z positive, Z negative. Faces that are not visible are
+            `COLOURS.CUBE.BLANK`.
+        - Assigning a new array clears the cached layouts / representations.
+            Modifying the array in place does not, so reassign it afterwards
+            (e.g. `cube.colours = cube.colours`).
+        - Assigned arrays are stored as C-contiguous `int8` arrays, and must
+            be `(P, 6)` integer arrays of colour IDs.
     - coord_vals : `list[float]`
         - List of all the possible values `Cube_Piece` coordinates can be.
     - edge_val : `float`
         - Coordinate value of the edge of the cube.
     - pcs : `list[Cube_Piece]`
-        - List of `Cube_Piece` instances that make up the cube.
+        - List of `Cube_Piece` instances that make up the cube, created from
+            the current `pos` and `colours` arrays.
+    - pos : `np.ndarray`
+        - `(P, 3)` read-only array of the X, Y, Z coordinates of each visible
+            piece. Each row of `colours` always refers to the piece in the
+            same row of `pos`, so the positions never change when rotating.
     - size : `int`
         - Size of the cube.
     
@@ -71,6 +109,42 @@ class Cube(OBJ):
         - Gets all data from the current instance of the object.
     '''
 
+    __slots__ = (
+        'coord_vals',
+        'edge_val',
+        'odd',
+        'pos',
+        'size',
+        '_colours',
+        '_face_idx',
+        '_lattice',
+        '_layout_cache',
+        '_move_codes',
+        '_moves',
+        '_slots',
+    )
+
+    # colour character of each colour ID
+    _CHARS: np.ndarray = np.array(COLOURS.CUBE.CHAR)
+
+    # =========
+    # Allocator
+    def __new__(
+            cls,
+            size: int = 3
+    ) -> 'Cube':
+        # 3x3x3 cubes are `Cube3` instances (see `Cube3`)
+        if (cls is Cube) and isinstance(size, int) and (size == 3):
+            return super().__new__(Cube3)
+        return super().__new__(cls)
+
+    # ==============================
+    # Allocator Arguments (Pickling)
+    def __getnewargs__(self) -> tuple[int]:
+        # `copy` / `pickle` pass the real size to `__new__()`, so copies of
+        #  other sizes are not dispatched to `Cube3`
+        return (self.size,)
+
     # ===========
     # Constructor
     def __init__(
@@ -87,72 +161,61 @@ class Cube(OBJ):
                 f'Cube.__init__(): size must be greater than 1, got {size}.'
             )
         
-        # initializing attributes
-        self.coord_vals: list[float] = []
-        self.edge_val: float = 0
-        self.size: int = size
-        self.odd: bool = self.size % 2 == 1
-        self.pcs: list[Cube_Piece] = []
-
-        # setting cube limits + coordinate values
-        if not self.odd:
-            self.edge_val = (size // 2) - 0.5
-            self.coord_vals = [
-                (i//10)+0.5
-                for i in range(
-                    int(-10*self.edge_val),
-                    int(10*self.edge_val)
-                )
-            ]
-        else:
-            self.edge_val = (size - 1) // 2
-            self.coord_vals = [
-                i
-                for i in range(
-                    int(-1*self.edge_val),
-                    int(self.edge_val + 1)
-                )
-            ]
+        # initializing attributes - only the colours and `coord_vals` are
+        #  copied from the solved cube of the same size, all other (read-only)
+        #  attributes are shared with it (see `_get_template()`)
+        super().__init__()
+        template: Cube = self._get_template(size)
+        self._colours: np.ndarray = template._colours.copy()
+        self.coord_vals: list[float] = list(template.coord_vals)
+        self.edge_val: float = template.edge_val
+        self.odd: bool = template.odd
+        self.pos: np.ndarray = template.pos
+        self.size: int = template.size
+        self._face_idx: dict[str, np.ndarray] = template._face_idx
+        self._lattice: np.ndarray = template._lattice
+        self._layout_cache: dict[str, str] = {}
+        self._move_codes: np.ndarray = template._move_codes
+        self._moves: dict[str, np.ndarray] = template._moves
+        self._slots: np.ndarray = template._slots
+
+    # ============
+    # Cube Colours
+    @property
+    def colours(self) -> np.ndarray:
+        ''' Cube Colours. '''
+        return self._colours
+    @colours.setter
+    def colours(self, data: np.ndarray) -> None:
+        # validate the colours - before converting to `int8`, so that other
+        #  values cannot wrap around into valid colour IDs
+        data = np.asarray(data)
+        if (
+                (not np.issubdtype(data.dtype, np.integer))
+                or (data.shape != (len(self.pos), 6))
+        ):
+            raise ValueError(
+                f'Cube.colours: colours must be a ({len(self.pos)}, 6) ' \
+                + f'integer array, got a {data.shape} {data.dtype} array.'
+            )
+        if (data.min() < 0) or (data.max() > COLOURS.CUBE.BLANK):
+            raise ValueError(
+                'Cube.colours: colours must be in the range ' \
+                + f'[0, {COLOURS.CUBE.BLANK}], got values in the range ' \
+                + f'[{data.min()}, {data.max()}].'
+            )
 
-        # create cube pieces
-        for i in self.coord_vals:
-            for j in self.coord_vals:
-                for k in self.coord_vals:
-                    # skip all non-visible pieces
-                    if not (
-                            (abs(i) == self.edge_val)
-                            or (abs(j) == self.edge_val)
-                            or (abs(k) == self.edge_val)
-                    ): continue
-
-                    # create cube piece
-                    self.pcs.append(Cube_Piece(
-                        pos = (i, j, k),
-                        col_xp = {
-                            True: COLOURS.CUBE.B, 
-                            False: None
-                        }[i == self.edge_val],
-                        col_xn = {
-                            True: COLOURS.CUBE.G, 
-                            False: None
-                        }[i == -1*self.edge_val],
-                        col_yp = {
-                            True: COLOURS.CUBE.W, 
-                            False: None
-                        }[j == self.edge_val],
-                        col_yn = {
-                            True: COLOURS.CUBE.Y, 
-                            False: None
-                        }[j == -1*self.edge_val],
-                        col_zp = {
-                            True: COLOURS.CUBE.R, 
-                            False: None
-                        }[k == self.edge_val],
-                        col_zn = {
-                            True: COLOURS.CUBE.O, 
-                            False: None
-                        }[k == -1*self.edge_val]
-                    ))
+        # the compiled kernels need a writeable C-contiguous `int8` array -
+        #  only copied if needed, as `np.ascontiguousarray()` also copies the
+        #  `int8` arrays returned by the kernels
+        if (
+                (data.dtype != np.int8)
+                or (not data.flags.c_contiguous)
+                or (not data.flags.writeable)
+        ):
+            data = np.array(data, dtype=np.int8, order='C')
+        self._colours = data
+        self._clear_cache()
 
     # ======================
     # Cube Prettified Layout
@@ -178,42 +241,60 @@ class Cube(OBJ):
     @property
     def layout_back(self) -> str:
         ''' Cube Prettified Layout - Back Face. '''
-        return self.stringify_face(self._get_layout('B', True))
+        return self._get_layout_str('B')
     
     # ==================================
     # Cube Prettified Layout - Down Face
     @property
     def layout_down(self) -> str:
         ''' Cube Prettified Layout - Down Face. '''
-        return self.stringify_face(self._get_layout('D', True))
+        return self._get_layout_str('D')
     
     # ===================================
     # Cube Prettified Layout - Front Face
     @property
     def layout_front(self) -> str:
         ''' Cube Prettified Layout - Front Face. '''
-        return self.stringify_face(self._get_layout('F', True))
+        return self._get_layout_str('F')
     
     # ==================================
     # Cube Prettified Layout - Left Face
     @property
     def layout_left(self) -> str:
         ''' Cube Prettified Layout - Left Face. '''
-        return self.stringify_face(self._get_layout('L', True))
+        return self._get_layout_str('L')
     
     # ===================================
     # Cube Prettified Layout - Right Face
     @property
     def layout_right(self) -> str:
         ''' Cube Prettified Layout - Right Face. '''
-        return self.stringify_face(self._get_layout('R', True))
+        return self._get_layout_str('R')
     
     # =================================
     # Cube Prettified Layout - Top Face
     @property
     def layout_top(self) -> str:
         ''' Cube Prettified Layout - Top Face. '''
-        return self.stringify_face(self._get_layout('U', True))
+        return self._get_layout_str('U')
+
+    # ===========
+    # Cube Pieces
+    @property
+    def pcs(self) -> list['Cube_Piece']:
+        ''' Cube Pieces. '''
+        return [
+            Cube_Piece(cast(_POS, tuple(pos)), *cols)
+            for pos, cols in zip(self.pos.tolist(), self.colours.tolist())
+        ]
+
+    # ================
+    # OBJ: Clear Cache
+    def _clear_cache(self) -> None:
+        # the face layouts are also cached (see `_get_layout_str()`), and are
+        #  rebound rather than cleared since shallow copies share the dict
+        super()._clear_cache()
+        self._layout_cache = {}
 
     # =============
     # OBJ: Get Data
@@ -228,10 +309,202 @@ class Cube(OBJ):
         return {
             'coord_vals': self.coord_vals,
             'edge_val': self.edge_val,
-            'pcs': self.pcs,
+            'pcs': self._render_pieces(),
             'size': self.size,
         }
     
+    # =================
+    # Build Move Tables
+    def _build_move_tables(self) -> None:
+        '''
+        Build Move Tables
+        -
+        Builds the permutation table for every valid rotation direction of the
+        current `Cube`, so that rotating the cube is a single gather of the
+        flattened `colours` array (`colours.reshape(-1)[perm]`). Also stacks
+        the permutations of each movement code (see `MOVE_NAMES`) into a
+        single array for `Cube.apply_sequence()`.
+
+        Parameters
+        -
+        None
+
+        Returns
+        -
+        None
+        '''
+
+        self._moves = {}
+        num_pcs: int = len(self.pos)
+        for direction in self._get_directions(self.size):
+            _, axis_str, num_rotations, rows = self._get_move(direction)
+            perm: np.ndarray = np.arange(
+                num_pcs * 6,
+                dtype=np.int32
+            ).reshape(num_pcs, 6)
+            self._rotate_pieces(perm, rows, axis_str, num_rotations)
+            self._moves[direction] = perm.reshape(-1)
+        self._move_codes = np.stack([self._moves[name] for name in MOVE_NAMES])
+
+    # =================
+    # Build Face Tables
+    def _build_face_tables(self) -> None:
+        '''
+        Build Face Tables
+        -
+        Builds the `(size, size)` table of flattened `colours` indexes for each
+        face of the current `Cube`, in the layout order of
+        `Cube._get_layout()`. Piece positions never change, so the face layouts
+        are a single gather of `colours` through these tables.
+
+        Parameters
+        -
+        None
+
+        Returns
+        -
+        None
+        '''
+
+        self._face_idx = {}
+        last: int = self.size - 1
+        for layer, (
+                col_axis,
+                col_polarity,
+                axis_x,
+                axis_y,
+                x_polarity,
+                y_polarity,
+        ) in {
+            'R': (0, 0, 2, 1, -1, -1),
+            'U': (1, 0, 0, 2, 1, 1),
+            'F': (2, 0, 0, 1, 1, -1),
+            'L': (0, 1, 2, 1, 1, -1),
+            'B': (2, 1, 0, 1, -1, -1),
+            'D': (1, 1, 0, 2, 1, -1),
+        }.items():
+            face_val: int = last if col_polarity == 0 else 0
+            rows: np.ndarray = np.nonzero(
+                self._lattice[:, col_axis] == face_val
+            )[0]
+            face_y: np.ndarray = self._lattice[rows, axis_y]
+            if y_polarity < 0: face_y = last - face_y
+            face_x: np.ndarray = self._lattice[rows, axis_x]
+            if x_polarity < 0: face_x = last - face_x
+            face: np.ndarray = np.empty(
+                (self.size, self.size),
+                dtype=np.int32
+            )
+            face[face_y, face_x] = (rows*6) + (col_axis*2) + col_polarity
+            self._face_idx[layer] = face
+
+    # =================
+    # Build Solved Cube
+    def _build_solved(self, size: int) -> None:
+        '''
+        Build Solved Cube
+        -
+        Initializes every attribute of the current `Cube` as a solved cube of
+        the given size, including its face / move tables (see
+        `_get_template()`). All of the arrays are made read-only.
+
+        Parameters
+        -
+        - size : `int`
+            - Size of the cube.
+
+        Returns
+        -
+        None
+        '''
+
+        # calculating cube limits + coordinate values
+        #  - coordinates are integers for odd sizes, half-integers for even
+        odd: bool = (size & 1) == 1
+        edge: float = ((size - 1) // 2) if odd else ((size - 1) / 2)
+        coords: np.ndarray = (
+            np.arange(size, dtype=(np.int8 if odd else np.float32)) - edge
+        )
+        last: int = size - 1
+
+        # create cube piece lattice indexes (`coord_vals` index of each
+        #  coordinate) - only the visible (surface) pieces, generated one X
+        #  layer at a time: the outer layers are a full (Y, Z) square, the
+        #  inner layers only the ring around its edge
+        idx: np.ndarray = np.arange(size, dtype=np.intp)
+        j, k = np.meshgrid(idx, idx, indexing='ij')
+        square: np.ndarray = np.stack([j.reshape(-1), k.reshape(-1)], axis=1)
+        ring: np.ndarray = square[
+            (np.isin(j, (0, last)) | np.isin(k, (0, last))).reshape(-1)
+        ]
+        layers: list[np.ndarray] = []
+        for val in range(size):
+            layer: np.ndarray = square if val in (0, last) else ring
+            layers.append(np.concatenate([
+                np.full((len(layer), 1), val, dtype=np.intp),
+                layer,
+            ], axis=1))
+        lattice: np.ndarray = np.concatenate(layers)
+        pos: np.ndarray = coords[lattice]
+        num_pcs: int = len(pos)
+
+        # lattice index -> piece index lookup (-1 for hidden pieces)
+        slots: np.ndarray = np.full((size, size, size), -1, dtype=np.int32)
+        slots[lattice[:, 0], lattice[:, 1], lattice[:, 2]] = np.arange(
+            num_pcs,
+            dtype=np.int32
+        )
+
+        # create cube piece colours - one column per face, blank if not visible
+        blank: int = COLOURS.CUBE.BLANK
+        colours: np.ndarray = np.full((num_pcs, 6), blank, dtype=np.int8)
+        for col, (axis, face_idx, colour) in enumerate([
+                (0, last, COLOURS.CUBE.B),
+                (0, 0, COLOURS.CUBE.G),
+                (1, last, COLOURS.CUBE.W),
+                (1, 0, COLOURS.CUBE.Y),
+                (2, last, COLOURS.CUBE.R),
+                (2, 0, COLOURS.CUBE.O),
+        ]):
+            colours[:, col] = np.where(
+                lattice[:, axis] == face_idx,
+                colour,
+                blank
+            )
+
+        # initializing attributes
+        OBJ.__init__(self)
+        self._colours: np.ndarray = colours
+        self.coord_vals: list[float] = coords.tolist()
+        self.edge_val: float = edge
+        self.odd: bool = odd
+        self.pos: np.ndarray = pos
+        self.size: int = size
+        self._face_idx: dict[str, np.ndarray]
+        self._lattice: np.ndarray = lattice
+        self._layout_cache: dict[str, str] = {}
+        self._move_codes: np.ndarray
+        self._moves: dict[str, np.ndarray]
+        self._slots: np.ndarray = slots
+
+        # precompute the `colours` indexes of each face + the permutation of
+        #  `colours` for each rotation
+        self._build_face_tables()
+        self._build_move_tables()
+
+        # the template never changes and is shared with every cube of the
+        #  same size, so it is read-only
+        for table in [
+                colours,
+                pos,
+                lattice,
+                slots,
+                self._move_codes,
+                *self._face_idx.values(),
+                *self._moves.values(),
+        ]:
+            table.flags.writeable = False
+
     # ====================
     # Get Center Positions
     def _get_centers(self) -> dict[str, str]:
@@ -264,10 +537,7 @@ class Cube(OBJ):
             )
 
         # initialize central positions
-        edge_val: float = {
-            True: self.edge_val,
-            False: self.edge_val + 0.5,
-        }[self.odd]
+        edge_val: float = self.edge_val if self.odd else self.edge_val + 0.5
         central_coordinates: dict[_POS, str] = {
             (edge_val, 0, 0,): 'R', # Positive X - Right
             (-1*edge_val, 0, 0,): 'L', # Negative X - Left
@@ -303,6 +573,125 @@ class Cube(OBJ):
 
         return output
     
+    # ===================
+    # Get Move Directions
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_directions(size: int) -> tuple[str, ...]:
+        '''
+        Get Move Directions
+        -
+        Gets all of the valid rotation directions for a `Cube` of the given
+        size. Cached per size, as every `Cube` of the same size shares them.
+
+        Parameters
+        -
+        - size : `int`
+            - Size of the cube.
+
+        Returns
+        -
+        - `tuple[str, ...]`
+            - All valid values for the `direction` parameter of
+                `Cube.rotate()`.
+        '''
+
+        _directions_inner: list[str] = [
+            _str
+            for _str_l in [
+                [
+                    _s*(i+1)
+                    for i in range((size-2)//2)
+                ]
+                for _s in ['b', 'd', 'f', 'l', 'r', 'u']
+            ]
+            for _str in _str_l
+        ]
+        _directions_outer: list[str] = ['B', 'D', 'F', 'L', 'R', 'U']
+        _directions_rotate: list[str] = ['x', 'y', 'z']
+        return tuple(
+            [
+                _str
+                for _str_l in [
+                    [
+                        f'{_s}{suffix}'
+                        for suffix in ['', '\'', '2']
+                    ]
+                    for _s in (
+                        _directions_outer \
+                        + _directions_inner \
+                        + _directions_rotate
+                    )
+                ]
+                for _str in _str_l
+            ] + [
+                f'{_s}w'
+                for _s in _directions_inner
+            ]
+        )
+
+    # =====================
+    # Get Layer Coordinates
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_layer_vals(
+            direction: str,
+            coord_vals: tuple[float, ...]
+    ) -> tuple[float, ...]:
+        '''
+        Get Layer Coordinates
+        -
+        Gets the coordinates (along the axis of rotation) of the layers turned
+        by rotating a cube in the given `direction`. Cached per direction and
+        cube size.
+
+        Parameters
+        -
+        - direction : `str`
+            - Direction to rotate the cube layer(s) in (see
+                `Cube._get_move()`).
+        - coord_vals : `tuple[float, ...]`
+            - All possible coordinate values of the cube (see `coord_vals`).
+
+        Returns
+        -
+        - `tuple[float, ...]`
+            - Coordinate values of the layers to rotate.
+        '''
+
+        char: str = direction[0]
+        if char in ['x', 'y', 'z']: return coord_vals
+        size: int = len(coord_vals)
+        edge: float = coord_vals[-1]
+        neg_edge: float = -1*edge
+        depth: int = direction.count(char)
+        wide: bool = 'w' in direction
+        layer_vals: list[float] = []
+        for i, val in enumerate(coord_vals):
+            if val == neg_edge:
+                if (
+                        (char in ['B', 'D', 'L'])
+                        or ((char in ['b', 'd', 'l']) and wide)
+                ):
+                    layer_vals.append(val)
+                    continue
+            if val == edge:
+                if (
+                        (char in ['F', 'R', 'U'])
+                        or ((char in ['f', 'r', 'u']) and wide)
+                ):
+                    layer_vals.append(val)
+                    continue
+
+            # for mid_section in range(1, self.size//2):
+            if char in ['l', 'f', 'u']:
+                if ((size-1-i) == depth) or (((size-1-i) < depth) and wide):
+                    layer_vals.append(val)
+            elif char in ['r', 'b', 'd']:
+                if (i == depth) or ((i < depth) and wide):
+                    layer_vals.append(val)
+        return tuple(layer_vals)
+
     # ================
     # Get Layer Layout
     def _get_layout(
@@ -349,88 +738,52 @@ class Cube(OBJ):
                 + f'"L", "R", "T", got {layer}.'
             )
         
-        # setting up face parameters
-        (
-            col_axis,
-            col_polarity,
-            axis_x,
-            axis_y,
-            x_polarity,
-            y_polarity,
-        ) = {
-            'R': (0, 0, 2, 1, -1, -1),
-            'U': (1, 0, 0, 2, 1, 1),
-            'F': (2, 0, 0, 1, 1, -1),
-            'L': (0, 1, 2, 1, 1, -1),
-            'B': (2, 1, 0, 1, -1, -1),
-            'D': (1, 1, 0, 2, 1, -1),
-        }[layer]
-
-        # initialize face data
-        face: list[list[str]] = [
-            [
-                '' 
-                for _ in range(self.size)
-            ]
-            for _ in range(self.size)
-        ]
-        for pce in self.pcs:
-            if pce.colours[col_axis][col_polarity] is None: continue
-            face[
-                self.coord_vals.index(
-                    pce.pos[axis_y]*y_polarity
-                )
-            ][
-                self.coord_vals.index(
-                    pce.pos[axis_x]*x_polarity
-                )
-            ] = cast(tuple[int, str], pce.colours[col_axis][col_polarity])[1]
+        face: list[list[str]] = self._CHARS[
+            self.colours.reshape(-1)[self._face_idx[layer]]
+        ].tolist()
 
         if face_only: return face
 
         return []
 
-    # ========================
-    # Solve Cube - White Cross
-    def _solve_white_cross(self) -> list[str]:
+    # ======================
+    # Get Face Layout String
+    def _get_layout_str(self, layer: str) -> str:
         '''
-        Solve Cube - White Cross
+        Get Face Layout String
         -
-        Solves the white cross component of the current `Cube` object. Returns
-        a list of strings containing the formulae used to solve the white cross
-        of the cube.
+        Gets the prettified layout of the given face (see `_get_layout()` and
+        `stringify_face()`). Cached until the cube is next rotated.
 
         Parameters
         -
-        None
+        - layer : `str`
+            - Letter value of the face to get the layout for (see
+                `_get_layout()`).
 
         Returns
         -
-        - `list[str]`
-            - List of formulae used to solve the white cross.
+        - `str`
+            - String representation of the face.
         '''
 
-        # initialize variables
-        formulae: list[str] = []
-        pce: Cube_Piece
-        orientation: dict[str, str] = self._get_centers()
-        
-        # move white to bottom
-        
-
-        return formulae
+        face_str: str | None = self._layout_cache.get(layer)
+        if face_str is None:
+            face_str = self.stringify_face(self._get_layout(layer, True))
+            self._layout_cache[layer] = face_str
+        return face_str
 
-    # ===============
-    # Rotate Layer(s)
-    def rotate(
+    # ========
+    # Get Move
+    def _get_move(
             self,
-            direction: str,
-            add_printing: bool = False
-    ) -> None:
+            direction: str
+    ) -> tuple[int, str, int, np.ndarray]:
         '''
-        Rotate Layer(s)
+        Get Move
         -
-        Rotates cube layer(s) by the given `direction`.
+        Calculates the axis, number of positive rotations, and pieces affected
+        by rotating the cube in the given `direction`.
 
         Parameters
         -
@@ -452,153 +805,410 @@ class Cube(OBJ):
                     by the number of letters prefixing the `"w"`).
                 - {"x", "y", "z"} : Clockwise rotation of the entire cube
                     around the given axis.
-        - add_printing : `bool`
-            - Whether or not to add a printout of the rotation.
+
+        Returns
+        -
+        - `tuple[int, str, int, np.ndarray]`
+            - Index of the axis to rotate around.
+            - Name of the axis to rotate around.
+            - Number of positive rotations around the axis.
+            - Indexes of the pieces (rows of `pos` / `colours`) to rotate.
         '''
 
-        # validate direction
-        valid_directions: list[str]
-        _directions_inner: list[str] = [
-            _str
-            for _str_l in [
-                [
-                    _s*(i+1)
-                    for i in range((self.size-2)//2)
-                ]
-                for _s in ['b', 'd', 'f', 'l', 'r', 'u']
-            ]
-            for _str in _str_l
-        ]
-        _directions_outer: list[str] = ['B', 'D', 'F', 'L', 'R', 'U']
-        _directions_rotate: list[str] = ['x', 'y', 'z']
-        valid_directions = (
-            [
-                _str
-                for _str_l in [
-                    [
-                        f'{_s}{suffix}'
-                        for suffix in ['', '\'', '2']
-                    ]
-                    for _s in (
-                        _directions_outer \
-                        + _directions_inner \
-                        + _directions_rotate
-                    )
-                ]
-                for _str in _str_l
-            ] + [
-                f'{_s}w'
-                for _s in _directions_inner
-            ]
-        )
-        if direction not in valid_directions:
-            raise ValueError(
-                f'Cube.rotate(): direction must be one of {valid_directions}, '
-                + f'got {direction}.'
-            )
-        
-        # calculate axis to rotate
-        axis, axis_str = {
-            (True, False, False): (0, 'x',),
-            (False, True, False): (1, 'y',),
-            (False, False, True): (2, 'z',),
-        }[(
-            direction[0] in ['x', 'l', 'L', 'r', 'R'],
-            direction[0] in ['y', 'd', 'D', 'u', 'U'],
-            direction[0] in ['z', 'b', 'B', 'f', 'F'],
-        )]
-        axis_negative: bool = direction[0] in ['f', 'F', 'r', 'R', 'u', 'U']
-
-        # calculate number of rotations for each piece
-        num_rotations: int = {
-            (True, False, False): 3,
-            (True, True, False): 2,
-            (True, False, True): 1,
-            (False, False, False): 1,
-            (False, True, False): 2,
-            (False, False, True): 3,
-        }[(
-            axis_negative, 
-            direction[-1] == '2',
-            direction[-1] == '\''
-        )]
+        # calculate axis to rotate (see `DIRECTION_AXIS`)
+        axis, axis_str = DIRECTION_AXIS[direction[0]]
+
+        # calculate number of rotations for each piece - clockwise turns of
+        #  the positive side of an axis are negative rotations
+        num_rotations: int = DIRECTION_TURNS.get(direction[-1], 1)
+        if direction[0] in DIRECTION_NEGATIVE:
+            num_rotations = 4 - num_rotations
 
         # calculate cube coordinates to rotate - layer number in the axis
         #  calculated above
-        layer_vals: list[float] = []
-        for i, val in enumerate(self.coord_vals):
-            if direction[0] in ['x', 'y', 'z']: 
-                layer_vals.append(val)
-                continue
-
-            if val == -1*self.edge_val:
-                if (
-                        (direction[0] in ['B', 'D', 'L'])
-                        or (
-                            (direction[0] in ['b', 'd', 'l'])
-                            and ('w' in direction)
-                        )
-                ):
-                    layer_vals.append(val)
-                    continue
-            if val == self.edge_val:
-                if (
-                        (direction[0] in ['F', 'R', 'U'])
-                        or (
-                            (direction[0] in ['f', 'r', 'u'])
-                            and ('w' in direction)
-                        )
-                ):
-                    layer_vals.append(val)
-                    continue
-
-            # for mid_section in range(1, self.size//2):
-            if direction[0] in ['b', 'd', 'f', 'l', 'r', 'u']:
-                if direction[0] in ['l', 'f', 'u']:
-                    if (
-                            ((self.size-1-i) == direction.count(direction[0]))
-                            or (
-                                (self.size-1-i) < direction.count(direction[0])
-                                and ('w' in direction)
-                            )
-                    ):
-                        layer_vals.append(val)
-                elif direction[0] in ['r', 'b', 'd']:
-                    if (
-                            (i == direction.count(direction[0]))
-                            or (
-                                (i < direction.count(direction[0]))
-                                and ('w' in direction)
-                            )
-                    ):
-                        layer_vals.append(val)
+        layer_vals: tuple[float, ...] = self._get_layer_vals(
+            direction,
+            tuple(self.coord_vals)
+        )
 
-        if add_printing:
-            print(
-                f'Direction: {direction}\n' \
-                + f'| - axis: {axis}, axis_str: {axis_str}\n' \
-                + f'| - num_rotations: {num_rotations}\n' \
-                + f'| - layer_vals: {layer_vals}\n'
-            )
+        rows: np.ndarray = np.nonzero(
+            np.isin(self.pos[:, axis], layer_vals)
+        )[0]
 
-        # rotate pieces
-        for pce in self.pcs:
-            if pce.pos[axis] in layer_vals:
-                for _ in range(num_rotations):
-                    pce.rotate(axis_str, add_printing)
+        return axis, axis_str, num_rotations, rows
 
-    # ==========
-    # Solve Cube
-    def solve(self) -> None:
+    # =================
+    # Get Template Cube
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_template(size: int) -> 'Cube':
         '''
-        Solve Cube
+        Get Template Cube
         -
-        Solves the current `Cube` object (after being scrambled), and prints
-        the solution for solving each part of the `Cube` step-by-step.
+        Gets the solved `Cube` of the given size (see `_build_solved()`),
+        bypassing the `Cube.__new__()` dispatch to `Cube3`. Cached per size, so
+        every `Cube` of the same size copies its colours from, and shares all
+        of its read-only tables with, the same template.
 
         Parameters
         -
-        None
+        - size : `int`
+            - Size of the cube.
+
+        Returns
+        -
+        - `Cube`
+            - Read-only solved cube of the given size.
+        '''
+
+        template: Cube = object.__new__(Cube)
+        template._build_solved(size)
+        return template
+
+    # =============
+    # Render Pieces
+    def _render_pieces(self) -> str:
+        '''
+        Render Pieces
+        -
+        Formats the short representation of every piece in the cube (as in
+        `str(Cube_Piece)`) as a single list string, in a single vectorised pass
+        over the `pos` and `colours` arrays rather than creating `Cube_Piece`
+        instances.
+
+        Parameters
+        -
+        None
+
+        Returns
+        -
+        - `str`
+            - List of the short representations of all pieces.
+        '''
+
+        # lookup tables - `coord_vals` string by lattice index, colour
+        #  character by colour ID
+        coords: np.ndarray = np.array([str(val) for val in self.coord_vals])
+        colours: np.ndarray = self._CHARS
+        pos: list[np.ndarray] = [
+            coords[self._lattice[:, i]]
+            for i in range(3)
+        ]
+        cols: list[np.ndarray] = [
+            colours[self.colours[:, i]]
+            for i in range(6)
+        ]
+
+        rendered: np.ndarray = np.array('<Cube_Piecepos = (')
+        for part in [
+                pos[0], ', ', pos[1], ', ', pos[2],
+                '), colours = Front: ', cols[4],
+                ', Back: ', cols[5],
+                ', Left: ', cols[1],
+                ', Right: ', cols[0],
+                ', Top: ', cols[2],
+                ', Down: ', cols[3],
+                ' />',
+        ]:
+            rendered = np.char.add(rendered, part)
+
+        return '[' + ',\n\t\t'.join(rendered.tolist()) + ']'
+
+    # =============
+    # Rotate Pieces
+    def _rotate_pieces(
+            self,
+            arr: np.ndarray,
+            rows: np.ndarray,
+            axis: str,
+            num_rotations: int = 1
+    ) -> None:
+        '''
+        Rotate Pieces
+        -
+        Rotates the pieces in the given rows of `arr` by `num_rotations`
+        positive rotations around the given axis, applied as a single composed
+        rotation. Piece positions stay fixed, so the values of each piece are
+        moved into the row of the position it is rotated into.
+
+        Parameters
+        -
+        - arr : `np.ndarray`
+            - `(P, 6)` array of per-face values to rotate in place (e.g.
+                `colours`).
+        - rows : `np.ndarray`
+            - Indexes of the pieces (rows of `pos` / `colours`) to rotate.
+        - axis : `str`
+            - Axis to rotate the pieces around.
+            - Valid Options:
+                - `"x"` : X-Axis Rotation.
+                - `"y"` : Y-Axis Rotation.
+                - `"z"` : Z-Axis Rotation.
+        - num_rotations : `int`
+            - Number of positive rotations around the axis, from 1 to 3.
+
+        Returns
+        -
+        None
+        '''
+
+        # rotate position (see `POS_PERM`) - negating a coordinate mirrors
+        #  its lattice index
+        axis_order, axis_sign = POS_PERM[(axis, num_rotations)]
+        lattice: np.ndarray = self._lattice[rows][:, axis_order]
+        lattice = np.where(axis_sign < 0, (self.size - 1) - lattice, lattice)
+        dest: np.ndarray = self._slots[
+            lattice[:, 0], lattice[:, 1], lattice[:, 2]
+        ]
+
+        # move colours (see `COL_PERM`)
+        arr[dest] = arr[rows][:, COL_PERM[(axis, num_rotations)]]
+
+    # ========================
+    # Solve Cube - White Cross
+    def _solve_white_cross(self) -> list[str]:
+        '''
+        Solve Cube - White Cross
+        -
+        Solves the white cross component of the current `Cube` object. Returns
+        a list of strings containing the formulae used to solve the white cross
+        of the cube.
+
+        Parameters
+        -
+        None
+
+        Returns
+        -
+        - `list[str]`
+            - List of formulae used to solve the white cross.
+        '''
+
+        # initialize variables
+        formulae: list[str] = []
+        pce: Cube_Piece
+        orientation: dict[str, str] = self._get_centers()
+        
+        # move white to bottom
+        
+
+        return formulae
+
+    # =================
+    # Apply Rotation(s)
+    def apply(
+            self,
+            moves: str
+    ) -> None:
+        '''
+        Apply Rotation(s)
+        -
+        Rotates the cube by each of the space-separated directions in the given
+        `moves` string. Brackets are ignored.
+
+        The meaning of lowercase letters depends on the cube size:
+        - 3x3x3 cubes compile `moves` with the 3x3x3 notation of the formulae
+            in `MOVES` (e.g. `"(R U' R' d R' U' R)"`), where lowercase letters
+            are wide turns (see `MOVES` and `Cube.apply_sequence()`).
+        - Other cubes rotate by each direction in turn with `Cube.rotate()`,
+            where lowercase letters are inner layer turns. The formulae in
+            `MOVES` are only valid on these cubes if they only use uppercase
+            face turns and whole cube rotations.
+
+        Parameters
+        -
+        - moves : `str`
+            - Space-separated directions to rotate the cube in.
+
+        Returns
+        -
+        None
+        '''
+
+        if self.size == 3:
+            self.apply_sequence(_compile_alg(moves))
+            return
+
+        for direction in moves.replace('(', ' ').replace(')', ' ').split():
+            self.rotate(direction)
+
+    # ==========================
+    # Apply Compiled Rotation(s)
+    def apply_sequence(
+            self,
+            codes: np.ndarray
+    ) -> None:
+        '''
+        Apply Compiled Rotation(s)
+        -
+        Rotates the cube by each of the movement codes (see `MOVE_NAMES`) in
+        the given compiled movement sequence, such as the `_C` attributes of
+        `MOVES`.
+
+        Parameters
+        -
+        - codes : `np.ndarray`
+            - Integer array of movement codes.
+
+        Returns
+        -
+        None
+        '''
+
+        # validate codes - before converting to `int8`, so that non-integer or
+        #  out of range codes cannot be truncated / wrap around into valid ones
+        codes = np.asarray(codes)
+        if codes.size and not np.issubdtype(codes.dtype, np.integer):
+            raise TypeError(
+                'Cube.apply_sequence(): codes must be integers, got ' \
+                + f'{codes.dtype}.'
+            )
+        if codes.size and (
+                (codes.min() < 0)
+                or (codes.max() >= len(MOVE_NAMES))
+        ):
+            raise ValueError(
+                'Cube.apply_sequence(): codes must be in the range ' \
+                + f'[0, {len(MOVE_NAMES)}), got {codes}.'
+            )
+
+        self._colours = apply_perms(
+            self._colours,
+            self._move_codes,
+            np.ascontiguousarray(codes.reshape(-1), dtype=np.int8)
+        )
+        self._clear_cache()
+
+    # ==========
+    # Clone Cube
+    def clone(self) -> 'Cube':
+        '''
+        Clone Cube
+        -
+        Creates a copy of the current `Cube` object. Only the `colours` array
+        and `coord_vals` list are copied, all other attributes (positions,
+        lookup / move tables) are read-only and shared with the original
+        `Cube`.
+
+        Parameters
+        -
+        None
+
+        Returns
+        -
+        - `Cube`
+            - Copy of the current `Cube` object.
+        '''
+
+        cube: Cube = object.__new__(self.__class__)
+        cube._repr_cache = self._repr_cache
+        cube._str_cache = self._str_cache
+        cube._colours = self._colours.copy()
+        cube.coord_vals = list(self.coord_vals)
+        cube.edge_val = self.edge_val
+        cube.odd = self.odd
+        cube.pos = self.pos
+        cube.size = self.size
+        cube._face_idx = self._face_idx
+        cube._lattice = self._lattice
+        cube._layout_cache = dict(self._layout_cache)
+        cube._move_codes = self._move_codes
+        cube._moves = self._moves
+        cube._slots = self._slots
+        return cube
+
+    # =================
+    # Check Cube Solved
+    def is_solved(self) -> bool:
+        '''
+        Check Cube Solved
+        -
+        Checks whether or not each face of the current `Cube` object only
+        contains a single colour.
+
+        Parameters
+        -
+        None
+
+        Returns
+        -
+        - `bool`
+            - Whether or not the cube is solved.
+        '''
+
+        return is_solved(self.colours)
+
+    # ===============
+    # Rotate Layer(s)
+    def rotate(
+            self,
+            direction: str,
+            add_printing: bool = False
+    ) -> None:
+        '''
+        Rotate Layer(s)
+        -
+        Rotates cube layer(s) by the given `direction`.
+
+        Parameters
+        -
+        - direction : `str`
+            - Direction to rotate the cube layer(s) in.
+            - Valid Options:
+                - {"B", "D", "F", "L", "R", "T"} : Clockwise rotation of the
+                    given layer.
+                - {"B'", "D'", "F'", "L'", "R'", "T'"} : Counterclockwise
+                    rotation of the given layer.
+                - {"B2", "D2", "F2", "L2", "R2", "T2"} : 180 degrees rotation
+                    of the given layer.
+                - {"b", "d", "f", "l", "r", "t"} : Clockwise rotating of the
+                    given layer (2nd layer from the outside).
+                - {"bb", "dd", "ff", "ll", "rr", "tt"} : Clockwise rotation
+                    of the given layer (3rd layer from the outside).
+                - {"bw", "dw", "fw", "lw", "rw", "tw"} : Clockwise rotation
+                    of all layers between the outer and inner layer (indicated
+                    by the number of letters prefixing the `"w"`).
+                - {"x", "y", "z"} : Clockwise rotation of the entire cube
+                    around the given axis.
+        - add_printing : `bool`
+            - Whether or not to add a printout of the rotation.
+        '''
+
+        # validate direction
+        if direction not in self._moves:
+            raise ValueError(
+                'Cube.rotate(): direction must be one of ' \
+                + f'{list(self._moves)}, got {direction}.'
+            )
+
+        if add_printing:
+            axis, axis_str, num_rotations, rows = self._get_move(direction)
+            layer_vals: list[float] = np.unique(
+                self.pos[rows, axis]
+            ).tolist()
+            print(
+                f'Direction: {direction}\n' \
+                + f'| - axis: {axis}, axis_str: {axis_str}\n' \
+                + f'| - num_rotations: {num_rotations}\n' \
+                + f'| - layer_vals: {layer_vals}\n'
+            )
+
+        # rotate pieces
+        self._colours = apply_perm(self._colours, self._moves[direction])
+        self._clear_cache()
+
+    # ==========
+    # Solve Cube
+    def solve(self) -> None:
+        '''
+        Solve Cube
+        -
+        Solves the current `Cube` object (after being scrambled), and prints
+        the solution for solving each part of the `Cube` step-by-step.
+
+        Parameters
+        -
+        None
 
         Returns
         -
@@ -608,6 +1218,28 @@ class Cube(OBJ):
         # solve the white cross
         self._solve_white_cross()
 
+    # ==============
+    # Cube State Key
+    def state_key(self) -> bytes:
+        '''
+        Cube State Key
+        -
+        Gets a hashable key of the current colours of the `Cube` object, for
+        use in transposition tables. Cubes of the same size have equal keys
+        if and only if they have the same colours.
+
+        Parameters
+        -
+        None
+
+        Returns
+        -
+        - `bytes`
+            - Raw bytes of the `colours` array.
+        '''
+
+        return self.colours.tobytes()
+
     # =======================
     # Stringify 2D Face Array
     def stringify_face(self, face: list[list[str]]) -> str:
@@ -627,11 +1259,39 @@ class Cube(OBJ):
             - A string representation of the 2D face array.
         '''
 
-        output: str = '+' + ('-'*((self.size*3)+(self.size-1))) + '+\n'
+        border: str = '+' + ('-'*((self.size*3)+(self.size-1))) + '+'
+        parts: list[str] = [border]
         for row in face:
-            output += '|' + ' '.join([f'"{col}"' for col in row]) + '|\n'
-        output += '+' + ('-'*((self.size*3)+(self.size-1))) + '+'
-        return output
+            parts.append('|' + ' '.join([f'"{col}"' for col in row]) + '|')
+        parts.append(border)
+        return '\n'.join(parts)
+
+
+# ==========
+# 3x3x3 Cube
+class Cube3(Cube):
+    '''
+    3x3x3 Rubik's Cube
+    -
+    `Cube` specialised for `size=3`, the size used by the 3x3x3 notation of
+    the formulae in `MOVES` (see `Cube.apply()`). Its solved template (see
+    `Cube._get_template()`) is built at import.
+
+    `Cube(3)` returns a `Cube3` instance.
+    '''
+
+    __slots__ = ()
+
+    # ===========
+    # Constructor
+    def __init__(
+            self,
+            size: int = 3
+    ) -> None:
+        # validating parameters
+        if size != 3:
+            raise ValueError(f'Cube3.__init__(): size must be 3, got {size}.')
+        super().__init__(size)
 
 
 # ==========
@@ -644,18 +1304,6 @@ class Cube_Piece(OBJ):
 
     Attributes
     -
-    - _col_xp : `_COLOUR`
-        - Colour of the piece in the positive X-axis direction.
-    - _col_xn : `_COLOUR`
-        - Colour of the piece in the negative X-axis direction.
-    - _col_yp : `_COLOUR`
-        - Colour of the piece in the positive Y-axis direction.
-    - _col_yn : `_COLOUR`
-        - Colour of the piece in the negative Y-axis direction.
-    - _col_zp : `_COLOUR`
-        - Colour of the piece in the positive Z-axis direction.
-    - _col_zn : `_COLOUR`
-        - Colour of the piece in the negative Z-axis direction.
     - colours : `_COLOUR_PIECE_CUBE`
         - Collection of all colour values on the cube piece.
     - colours_str : `str`
@@ -674,60 +1322,51 @@ class Cube_Piece(OBJ):
         - Rotates the cube piece around the given axis.
     '''
 
+    __slots__ = (
+        '_colours',
+        '_pos',
+    )
+
     # ===========
     # Constructor
     def __init__(
             self,
             pos: _POS,
-            col_xp: _COLOUR = None,
-            col_xn: _COLOUR = None,
-            col_yp: _COLOUR = None,
-            col_yn: _COLOUR = None,
-            col_zp: _COLOUR = None,
-            col_zn: _COLOUR = None
+            col_xp: _COLOUR = COLOURS.CUBE.BLANK,
+            col_xn: _COLOUR = COLOURS.CUBE.BLANK,
+            col_yp: _COLOUR = COLOURS.CUBE.BLANK,
+            col_yn: _COLOUR = COLOURS.CUBE.BLANK,
+            col_zp: _COLOUR = COLOURS.CUBE.BLANK,
+            col_zn: _COLOUR = COLOURS.CUBE.BLANK
     ) -> None:
-        self._col_xp: _COLOUR = col_xp
-        self._col_xn: _COLOUR = col_xn
-        self._col_yp: _COLOUR = col_yp
-        self._col_yn: _COLOUR = col_yn
-        self._col_zp: _COLOUR = col_zp
-        self._col_zn: _COLOUR = col_zn
-        self.pos: _POS = pos
+        super().__init__()
+        self._colours: _COLOUR_PIECE_CUBE = (
+            col_xp, col_xn, col_yp, col_yn, col_zp, col_zn
+        )
+        self._pos: _POS = pos
 
     # =============
     # Piece Colours
     @property
     def colours(self) -> _COLOUR_PIECE_CUBE:
         ''' Piece Colours. '''
-        return (
-            (self._col_xp, self._col_xn,),
-            (self._col_yp, self._col_yn,),
-            (self._col_zp, self._col_zn,),
-        )
+        return self._colours
     @colours.setter
     def colours(self, data: _COLOUR_PIECE_CUBE) -> None:
-        (
-            (self._col_xp, self._col_xn,),
-            (self._col_yp, self._col_yn,),
-            (self._col_zp, self._col_zn,),
-        ) = data
+        self._colours = cast(_COLOUR_PIECE_CUBE, tuple(data))
+        self._clear_cache()
 
     # ======================
     # Piece Colours - String
     @property
     def colours_str(self) -> str:
         ''' Piece Colours - String Format. '''
-        return ', '.join([
-            f'{f}: {c}'
-            for f, c in [
-                ('Front', self._col_zp),
-                ('Back', self._col_zn),
-                ('Left', self._col_xn),
-                ('Right', self._col_xp),
-                ('Top', self._col_yp),
-                ('Down', self._col_yn),
-            ]
-        ])
+        char: tuple[str, ...] = COLOURS.CUBE.CHAR
+        xp, xn, yp, yn, zp, zn = self.colours
+        return (
+            f'Front: {char[zp]}, Back: {char[zn]}, Left: {char[xn]}, '
+            f'Right: {char[xp]}, Top: {char[yp]}, Down: {char[yn]}'
+        )
     
     # =================================
     # Piece Colours - Minimalist String
@@ -735,11 +1374,21 @@ class Cube_Piece(OBJ):
     def colours_str_min(self) -> str:
         ''' Piece Colours - Minimalist String. '''
         return ','.join([
-            col[1]
-            for col_axis in self.colours
-            for col in col_axis
-            if col is not None
+            COLOURS.CUBE.CHAR[col]
+            for col in self.colours
+            if col != COLOURS.CUBE.BLANK
         ])
+
+    # ==============
+    # Piece Position
+    @property
+    def pos(self) -> _POS:
+        ''' Piece Position. '''
+        return self._pos
+    @pos.setter
+    def pos(self, data: _POS) -> None:
+        self._pos = data
+        self._clear_cache()
     
     # =============
     # OBJ: Get Data
@@ -798,37 +1447,18 @@ class Cube_Piece(OBJ):
                 + f'\t| - Colours: {self.colours_str}'
             )
         
-        # rotate position
+        # rotate position (see `ROT_POS`)
         #  x' = (x, -z, y)
         #  y' = (z, y, -x)
         #  z' = (-y, x, z)
-        self.pos = {
-            "x": (self.pos[0], -1*self.pos[2], self.pos[1]),
-            "y": (self.pos[2], self.pos[1], -1*self.pos[0]),
-            "z": (-1*self.pos[1], self.pos[0], self.pos[2]),
-        }[axis]
+        self._pos = ROT_POS[axis](self._pos)
 
-        # move colours
+        # move colours (see `ROT_COL`)
         #  x': +y -> +z
         #  y': +z -> +x
         #  z': +x -> +y
-        self.colours = {
-            "x": (
-                self.colours[0],
-                (self.colours[2][1], self.colours[2][0]),
-                (self.colours[1][0], self.colours[1][1]),
-            ),
-            "y": (
-                (self.colours[2][0], self.colours[2][1]),
-                self.colours[1],
-                (self.colours[0][1], self.colours[0][0]),
-            ),
-            "z": (
-                (self.colours[1][1], self.colours[1][0]),
-                (self.colours[0][0], self.colours[0][1]),
-                self.colours[2],
-            )
-        }[axis]
+        self._colours = ROT_COL[axis](self._colours)
+        self._clear_cache()
 
         if add_printing:
             print(
@@ -838,6 +1468,495 @@ class Cube_Piece(OBJ):
             )
 
 
+# ======================
+# 3x3x3 Cube Piece State
+class Cube3State(OBJ):
+    '''
+    3x3x3 Rubik's Cube Piece State
+    -
+    Solver-facing state of a 3x3x3 rubik's cube, storing the permutation and
+    orientation of the 8 corner pieces and 12 edge pieces as 4 packed 64-bit
+    integers. Each face turn only rewrites the 4 corner and 4 edge lanes it
+    moves, using shifts and masks from precomputed tables in a compiled
+    kernel, rather than rotating any pieces.
+
+    Convert from / to a `Cube` (for rendering) with `Cube3State.from_cube()`
+    and `Cube3State.to_cube()`. Only face turns are supported, as the centres
+    of the cube are not tracked.
+
+    Attributes
+    -
+    - co : `int`
+        - Corner orientations, 2 bits per corner position (0, 1 or 2
+            clockwise twists of the white / yellow sticker).
+    - cp : `int`
+        - Corner permutation, 4 bits per corner position (the corner piece in
+            that position).
+    - eo : `int`
+        - Edge orientations, 1 bit per edge position.
+    - ep : `int`
+        - Edge permutation, 4 bits per edge position (the edge piece in that
+            position).
+
+    Methods
+    -
+    - _get_data(short=False) : `_DATA`
+        - `OBJ` Instance Method.
+        - Gets all data from the current instance of the object.
+    - apply(moves) : `None`
+        - Instance Method.
+        - Applies each of the face turns in the given `moves` string.
+    - apply_sequence(codes) : `None`
+        - Instance Method.
+        - Applies each of the face turn movement codes in `codes`.
+    - from_cube(cube) : `Cube3State`
+        - Class Method.
+        - Creates the piece state of the given 3x3x3 `Cube`.
+    - is_solved() : `bool`
+        - Instance Method.
+        - Checks whether or not the state is solved.
+    - to_cube() : `Cube`
+        - Instance Method.
+        - Creates a `Cube` with the current piece state.
+    '''
+
+    __slots__ = (
+        '_co',
+        '_cp',
+        '_eo',
+        '_ep',
+    )
+
+    # corner / edge positions as flattened `Cube.colours` indexes, with the
+    #  orientation sticker first (corners ordered clockwise)
+    _CORNERS: list[tuple[int, ...]] = []
+    _EDGES: list[tuple[int, ...]] = []
+
+    # per face turn movement code: (source position, destination position,
+    #  orientation change) of each of the 4 corners / edges it moves
+    _CORNER_LANES: np.ndarray
+    _EDGE_LANES: np.ndarray
+
+    # solved `Cube.colours` for a 3x3x3 cube
+    _SOLVED: np.ndarray
+
+    _SOLVED_CP: int = sum(i << (4*i) for i in range(8))
+    _SOLVED_EP: int = sum(i << (4*i) for i in range(12))
+
+    # ===========
+    # Constructor
+    def __init__(
+            self,
+            cp: int = _SOLVED_CP,
+            co: int = 0,
+            ep: int = _SOLVED_EP,
+            eo: int = 0
+    ) -> None:
+        super().__init__()
+        self._cp: int = cp
+        self._co: int = co
+        self._ep: int = ep
+        self._eo: int = eo
+
+    # ===================
+    # Corner Orientations
+    @property
+    def co(self) -> int:
+        ''' Corner Orientations. '''
+        return self._co
+    @co.setter
+    def co(self, data: int) -> None:
+        self._co = data
+        self._clear_cache()
+
+    # ==================
+    # Corner Permutation
+    @property
+    def cp(self) -> int:
+        ''' Corner Permutation. '''
+        return self._cp
+    @cp.setter
+    def cp(self, data: int) -> None:
+        self._cp = data
+        self._clear_cache()
+
+    # =================
+    # Edge Orientations
+    @property
+    def eo(self) -> int:
+        ''' Edge Orientations. '''
+        return self._eo
+    @eo.setter
+    def eo(self, data: int) -> None:
+        self._eo = data
+        self._clear_cache()
+
+    # ================
+    # Edge Permutation
+    @property
+    def ep(self) -> int:
+        ''' Edge Permutation. '''
+        return self._ep
+    @ep.setter
+    def ep(self, data: int) -> None:
+        self._ep = data
+        self._clear_cache()
+
+    # =============
+    # OBJ: Get Data
+    def _get_data(self, short: bool = False) -> _DATA:
+        return {
+            'cp': hex(self.cp),
+            'co': hex(self.co),
+            'ep': hex(self.ep),
+            'eo': hex(self.eo),
+        }
+
+    # ================
+    # Build Move Lanes
+    @staticmethod
+    def _build_lanes(
+            perm: list[int],
+            pieces: list[tuple[int, ...]]
+    ) -> list[tuple[int, int, int]]:
+        '''
+        Build Move Lanes
+        -
+        Calculates where each corner / edge position is moved from by a face
+        turn, and how much its orientation changes.
+
+        Parameters
+        -
+        - perm : `list[int]`
+            - `Cube` move permutation of the face turn.
+        - pieces : `list[tuple[int, ...]]`
+            - Sticker indexes of each corner / edge position.
+
+        Returns
+        -
+        - `list[tuple[int, int, int]]`
+            - For each position, the index of the position its piece is moved
+                from, the index of the position, and the orientation change.
+        '''
+
+        lanes: list[tuple[int, int, int]] = []
+        num_ori: int = len(pieces[0])
+        for dest, stickers in enumerate(pieces):
+            src, shift = next(
+                (src, src_stickers.index(perm[stickers[0]]))
+                for src, src_stickers in enumerate(pieces)
+                if perm[stickers[0]] in src_stickers
+            )
+            lanes.append((src, dest, (num_ori - shift) % num_ori))
+        return lanes
+
+    # ============
+    # Build Tables
+    @classmethod
+    def _build_tables(cls) -> None:
+        '''
+        Build Tables
+        -
+        Builds the corner / edge positions and the face turn tables from the
+        move permutations of a solved 3x3x3 `Cube`.
+
+        Parameters
+        -
+        None
+
+        Returns
+        -
+        None
+        '''
+
+        cube: Cube = Cube(3)
+        cls._SOLVED = cube.colours.reshape(-1).copy()
+
+        # corner / edge positions
+        cls._CORNERS = []
+        cls._EDGES = []
+        for row, (x, y, z) in enumerate(cube.pos.tolist()):
+            # flattened index of the sticker on each axis of the piece
+            sticker: dict[int, int] = {
+                axis: (row * 6) + (axis * 2) + (0 if val > 0 else 1)
+                for axis, val in enumerate((x, y, z))
+                if val != 0
+            }
+            if len(sticker) == 3:
+                # y-axis sticker first, then clockwise from outside the cube
+                if x * y * z < 0:
+                    cls._CORNERS.append((sticker[1], sticker[0], sticker[2]))
+                else:
+                    cls._CORNERS.append((sticker[1], sticker[2], sticker[0]))
+            elif len(sticker) == 2:
+                cls._EDGES.append(tuple(
+                    sticker[axis]
+                    for axis in (1, 2, 0)
+                    if axis in sticker
+                ))
+
+        # face turn tables - only the lanes moved by each face turn (see
+        #  `MOVE_NAMES`, codes 0-17)
+        corners: list[list[tuple[int, int, int]]] = []
+        edges: list[list[tuple[int, int, int]]] = []
+        for name in MOVE_NAMES[:18]:
+            perm: list[int] = cube._moves[name].tolist()
+            for lanes, pieces in [
+                    (corners, cls._CORNERS),
+                    (edges, cls._EDGES),
+            ]:
+                lanes.append([
+                    lane
+                    for lane in cls._build_lanes(perm, pieces)
+                    if (lane[0] != lane[1]) or (lane[2] != 0)
+                ])
+        cls._CORNER_LANES = np.array(corners, dtype=np.int8)
+        cls._EDGE_LANES = np.array(edges, dtype=np.int8)
+
+    # ==================
+    # Apply Face Turn(s)
+    def apply(self, moves: str) -> None:
+        '''
+        Apply Face Turn(s)
+        -
+        Applies each of the space-separated face turns in the given `moves`
+        string. Brackets are ignored.
+
+        Parameters
+        -
+        - moves : `str`
+            - Space-separated face turns.
+            - Valid Options:
+                - {"B", "D", "F", "L", "R", "U"} : Clockwise rotation of the
+                    given layer.
+                - {"B'", "D'", "F'", "L'", "R'", "U'"} : Counterclockwise
+                    rotation of the given layer.
+                - {"B2", "D2", "F2", "L2", "R2", "U2"} : 180 degrees rotation
+                    of the given layer.
+
+        Returns
+        -
+        None
+        '''
+
+        codes: list[int] = []
+        for move in moves.replace('(', ' ').replace(')', ' ').split():
+            code: int = MOVE_CODES.get(move, -1)
+            if not (0 <= code < len(self._CORNER_LANES)):
+                raise ValueError(
+                    'Cube3State.apply(): moves must be one of ' \
+                    + f'{list(MOVE_NAMES[:len(self._CORNER_LANES)])}, got ' \
+                    + f'{move}.'
+                )
+            codes.append(code)
+        self.apply_sequence(np.array(codes, dtype=np.int64))
+
+    # ===========================
+    # Apply Compiled Face Turn(s)
+    def apply_sequence(self, codes: np.ndarray) -> None:
+        '''
+        Apply Compiled Face Turn(s)
+        -
+        Applies each of the face turn movement codes (see `MOVE_NAMES`) in the
+        given compiled movement sequence, in a single compiled kernel call.
+
+        Parameters
+        -
+        - codes : `np.ndarray`
+            - Integer array of movement codes, each a face turn (`0` to
+                `17`).
+
+        Returns
+        -
+        None
+        '''
+
+        # validate codes - before converting to `int64`, so that non-integer
+        #  codes cannot be truncated into valid ones
+        codes = np.asarray(codes)
+        if codes.size and not np.issubdtype(codes.dtype, np.integer):
+            raise TypeError(
+                'Cube3State.apply_sequence(): codes must be integers, got ' \
+                + f'{codes.dtype}.'
+            )
+
+        # apply the face turns - the codes are range checked by the kernel,
+        #  as `int64` so that no integer codes wrap around
+        cp, co, ep, eo = apply_state_moves(
+            self._cp, self._co, self._ep, self._eo,
+            self._CORNER_LANES, self._EDGE_LANES,
+            np.ascontiguousarray(codes, dtype=np.int64).reshape(-1)
+        )
+        if cp < 0:
+            raise ValueError(
+                'Cube3State.apply_sequence(): codes must be in the range ' \
+                + f'[0, {len(self._CORNER_LANES)}), got {codes}.'
+            )
+        self._cp, self._co, self._ep, self._eo = cp, co, ep, eo
+        self._clear_cache()
+
+    # ======================
+    # Create State from Cube
+    @classmethod
+    def from_cube(cls, cube: Cube) -> 'Cube3State':
+        '''
+        Create State from Cube
+        -
+        Creates the piece state of the given 3x3x3 `Cube`. The centres of the
+        `Cube` must be in their starting positions (i.e. the `Cube` has only
+        been moved with face turns).
+
+        Parameters
+        -
+        - cube : `Cube`
+            - 3x3x3 `Cube` to get the piece state of.
+
+        Returns
+        -
+        - `Cube3State`
+            - Piece state of the `Cube`.
+        '''
+
+        # validate cube
+        if cube.size != 3:
+            raise ValueError(
+                'Cube3State.from_cube(): cube.size must be 3, got ' \
+                + f'{cube.size}.'
+            )
+        colours: np.ndarray = cube.colours.reshape(-1)
+        centres: np.ndarray = np.nonzero(
+            np.count_nonzero(cube.pos, axis=1) == 1
+        )[0]
+        if not np.array_equal(
+                cube.colours[centres],
+                cls._SOLVED.reshape(-1, 6)[centres]
+        ):
+            raise ValueError(
+                'Cube3State.from_cube(): cube centres must be in their ' \
+                + 'starting positions.'
+            )
+
+        # find each piece + orientation
+        values: list[int] = []
+        for pieces, perm_bits, ori_bits in [
+                (cls._CORNERS, 4, 2),
+                (cls._EDGES, 4, 1),
+        ]:
+            solved: list[list[int]] = [
+                cls._SOLVED[list(stickers)].tolist()
+                for stickers in pieces
+            ]
+            perm_val: int = 0
+            ori_val: int = 0
+            for i, stickers in enumerate(pieces):
+                cols: list[int] = colours[list(stickers)].tolist()
+                pce: int = next(
+                    (
+                        j
+                        for j, solved_cols in enumerate(solved)
+                        if sorted(solved_cols) == sorted(cols)
+                    ),
+                    -1
+                )
+                if pce == -1:
+                    raise ValueError(
+                        'Cube3State.from_cube(): cube contains an invalid ' \
+                        + f'piece with colours {cols}.'
+                    )
+                perm_val |= pce << (perm_bits*i)
+                ori_val |= cols.index(solved[pce][0]) << (ori_bits*i)
+            values += [perm_val, ori_val]
+
+        return cls(*values)
+
+    # ===============
+    # Check if Solved
+    def is_solved(self) -> bool:
+        '''
+        Check if Solved
+        -
+        Checks whether or not every piece is in its solved position and
+        orientation.
+
+        Parameters
+        -
+        None
+
+        Returns
+        -
+        - `bool`
+            - Whether or not the state is solved.
+        '''
+
+        return (
+            (self.cp == self._SOLVED_CP)
+            and (self.co == 0)
+            and (self.ep == self._SOLVED_EP)
+            and (self.eo == 0)
+        )
+
+    # =========
+    # State Key
+    def state_key(self) -> int:
+        '''
+        State Key
+        -
+        Gets a hashable key of the current state, for use in transposition
+        tables, by packing `cp`, `co`, `ep` and `eo` into a single integer.
+
+        Parameters
+        -
+        None
+
+        Returns
+        -
+        - `int`
+            - 108-bit integer of the packed piece state.
+        '''
+
+        return self.cp | (self.co << 32) | (self.ep << 48) | (self.eo << 96)
+
+    # ======================
+    # Create Cube from State
+    def to_cube(self) -> Cube:
+        '''
+        Create Cube from State
+        -
+        Creates a 3x3x3 `Cube` with the current piece state.
+
+        Parameters
+        -
+        None
+
+        Returns
+        -
+        - `Cube`
+            - 3x3x3 `Cube` with the pieces in the current state.
+        '''
+
+        cube: Cube = Cube(3)
+        colours: np.ndarray = cube.colours.reshape(-1)
+        for pieces, cp, co, perm_bits, ori_bits in [
+                (self._CORNERS, self.cp, self.co, 4, 2),
+                (self._EDGES, self.ep, self.eo, 4, 1),
+        ]:
+            num_ori: int = len(pieces[0])
+            for i, stickers in enumerate(pieces):
+                pce: int = (cp >> (perm_bits*i)) & ((1 << perm_bits) - 1)
+                ori: int = (co >> (ori_bits*i)) & ((1 << ori_bits) - 1)
+                for j, sticker in enumerate(pieces[pce]):
+                    colours[stickers[(ori + j) % num_ori]] = (
+                        self._SOLVED[sticker]
+                    )
+        return cube
+
+
+# build the solved 3x3x3 template cube copied by `Cube3`
+Cube._get_template(3)
+
+# build the `Cube3State` face turn tables
+Cube3State._build_tables()
+
 '''
 
     - The centers of the cube are as follows: (X, Y, Z)
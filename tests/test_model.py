@@ -0,0 +1,340 @@
+# =============================================================================
+# Created By: Shaun Altmann
+# =============================================================================
+'''
+Rubik's Cube Model Tests
+-
+Tests of the Rubik's Cube Model, checking the compiled move tables / kernels
+against a per-piece reference that rotates each `Cube_Piece` in turn.
+'''
+# =============================================================================
+
+# =============================================================================
+# Imports
+# =============================================================================
+
+# used for copying / pickling cubes
+import copy
+import pickle
+
+# used for generating random movement sequences
+import random
+
+# used for the cube arrays
+import numpy as np
+
+# used for testing
+import pytest
+
+# used for the cube models
+from src._src import (
+    _compile_alg,
+    ALG_TABLE,
+    COLOURS,
+    MOVE_CODES,
+    MOVE_NAMES,
+)
+from src.model import (
+    Cube,
+    Cube3,
+    Cube3State,
+    Cube_Piece,
+)
+
+
+# =============================================================================
+# Constant Definitions
+# =============================================================================
+
+# cube sizes checked against the per-piece reference
+SIZES: list[int] = [2, 3, 4, 5, 6]
+
+# number of random movements in each checked sequence
+NUM_MOVES: int = 40
+
+# index of the axis rotated around, by the first character of a direction
+AXIS: dict[str, int] = {
+    **dict.fromkeys('xlLrR', 0),
+    **dict.fromkeys('ydDuU', 1),
+    **dict.fromkeys('zbBfF', 2),
+}
+
+
+# =============================================================================
+# Function Definitions
+# =============================================================================
+
+# ==================
+# Reference Rotation
+def _reference_rotate(
+        pcs: list[Cube_Piece],
+        layer_vals: tuple[float, ...],
+        direction: str
+) -> None:
+    '''
+    Reference Rotation
+    -
+    Rotates the pieces in the given layers one positive rotation at a time with
+    `Cube_Piece.rotate()`, as `Cube.rotate()` did before the move tables.
+
+    Parameters
+    -
+    - pcs : `list[Cube_Piece]`
+        - Pieces of the cube, rotated in place.
+    - layer_vals : `tuple[float, ...]`
+        - Coordinates (along the axis of rotation) of the layers to rotate.
+    - direction : `str`
+        - Direction to rotate the layers in (see `Cube.rotate()`).
+
+    Returns
+    -
+    None
+    '''
+
+    axis: int = AXIS[direction[0]]
+    num_rotations: int = {'\'': 3, '2': 2}.get(direction[-1], 1)
+    if direction[0] in 'fFrRuU':
+        num_rotations = 4 - num_rotations
+    for pce in pcs:
+        if pce.pos[axis] in layer_vals:
+            for _ in range(num_rotations):
+                pce.rotate('xyz'[axis])
+
+# =============
+# Cube Snapshot
+def _snapshot(pcs: list[Cube_Piece]) -> list[tuple]:
+    '''
+    Cube Snapshot
+    -
+    Gets the colours of every piece, ordered by piece position.
+
+    Parameters
+    -
+    - pcs : `list[Cube_Piece]`
+        - Pieces of the cube.
+
+    Returns
+    -
+    - `list[tuple]`
+        - `(pos, colours)` of each piece, sorted by `pos`.
+    '''
+
+    return sorted((tuple(pce.pos), tuple(pce.colours)) for pce in pcs)
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+# ==============
+# Colour Setters
+def test_colours_reassign_is_noop() -> None:
+    ''' `x.colours = x.colours` changes nothing. '''
+    pce: Cube_Piece = Cube_Piece((1, 1, 1), 0, 6, 1, 6, 2, 6)
+    pce.colours = pce.colours
+    assert pce.colours == (0, 6, 1, 6, 2, 6)
+
+    cube: Cube = Cube(3)
+    cube.rotate('R')
+    colours: np.ndarray = cube.colours
+    layout: str = cube.layout
+    cube.colours = cube.colours
+    assert cube.colours is colours
+    assert cube.layout == layout
+
+def test_colours_setter_normalises() -> None:
+    ''' `Cube.colours` stores valid arrays as C-contiguous `int8`. '''
+    cube: Cube = Cube(3)
+    cube.rotate('R')
+    expected: bytes = cube.state_key()
+    for data in [
+            cube.colours.astype(np.int64),
+            cube.colours.tolist(),
+            cube.colours[::-1][::-1],
+    ]:
+        cube.colours = data
+        assert cube.colours.dtype == np.int8
+        assert cube.colours.flags.c_contiguous
+        assert cube.state_key() == expected
+    for data in [
+            cube.colours[:-1],
+            cube.colours.astype(float),
+            cube.colours + COLOURS.CUBE.BLANK + 1,
+    ]:
+        with pytest.raises(ValueError):
+            cube.colours = data
+
+# ===========
+# Move Tables
+@pytest.mark.parametrize('size', SIZES)
+def test_move_tables_are_permutations(size: int) -> None:
+    ''' Every move is a permutation whose quarter turns cycle back. '''
+    cube: Cube = Cube(size)
+    ident: np.ndarray = np.arange(len(cube.pos) * 6)
+    for direction, perm in cube._moves.items():
+        assert np.array_equal(np.sort(perm), ident)
+        if direction[-1] not in ['\'', '2', 'w']:
+            assert np.array_equal(perm[cube._moves[f'{direction}\'']], ident)
+            assert np.array_equal(perm[perm], cube._moves[f'{direction}2'])
+    for code, name in enumerate(MOVE_NAMES):
+        assert np.array_equal(cube._move_codes[code], cube._moves[name])
+
+@pytest.mark.parametrize('size', SIZES)
+def test_rotate_matches_reference(size: int) -> None:
+    ''' `Cube.rotate()` matches rotating each `Cube_Piece`. '''
+    rng: random.Random = random.Random(size)
+    cube: Cube = Cube(size)
+    pcs: list[Cube_Piece] = cube.pcs
+    for direction in rng.choices(Cube._get_directions(size), k=NUM_MOVES):
+        cube.rotate(direction)
+        _reference_rotate(
+            pcs,
+            Cube._get_layer_vals(direction, tuple(cube.coord_vals)),
+            direction
+        )
+        assert _snapshot(cube.pcs) == _snapshot(pcs)
+
+@pytest.mark.parametrize('size', SIZES)
+def test_apply_sequence_matches_rotate(size: int) -> None:
+    ''' `Cube.apply_sequence()` / `Cube.apply()` match `Cube.rotate()`. '''
+    rng: random.Random = random.Random(size)
+    codes: list[int] = rng.choices(range(len(MOVE_NAMES)), k=NUM_MOVES)
+    expected: Cube = Cube(size)
+    for code in codes:
+        expected.rotate(MOVE_NAMES[code])
+
+    cube: Cube = Cube(size)
+    cube.apply_sequence(np.array(codes))
+    assert cube.state_key() == expected.state_key()
+
+    cube = Cube(size)
+    cube.apply(' '.join(MOVE_NAMES[code] for code in codes))
+    assert cube.state_key() == expected.state_key()
+
+@pytest.mark.parametrize('codes', [[1.7, 2], np.array([True])])
+def test_apply_sequence_rejects_non_integers(codes: list) -> None:
+    ''' Non-integer movement codes are not truncated into valid ones. '''
+    with pytest.raises(TypeError):
+        Cube(3).apply_sequence(codes)
+    with pytest.raises(TypeError):
+        Cube3State().apply_sequence(codes)
+
+@pytest.mark.parametrize('codes', [[-1], [len(MOVE_NAMES)], [256 + 1]])
+def test_apply_sequence_rejects_out_of_range(codes: list[int]) -> None:
+    ''' Out of range movement codes do not wrap around into valid ones. '''
+    cube: Cube = Cube(3)
+    with pytest.raises(ValueError):
+        cube.apply_sequence(codes)
+    assert cube.is_solved()
+    state: Cube3State = Cube3State()
+    with pytest.raises(ValueError):
+        state.apply_sequence(codes)
+    assert state.is_solved()
+
+# ===========================
+# Compiled Movement Sequences
+@pytest.mark.parametrize('alg, expected', [
+    ('R R', ['R2']),
+    ('R R\'', []),
+    ('R2 R2', []),
+    ('R R R', ['R\'']),
+    ('x x', ['x2']),
+    ('(R U) (U\' R)', ['R2']),
+    ('R U R\'', ['R', 'U', 'R\'']),
+])
+def test_compile_alg_fuses(alg: str, expected: list[str]) -> None:
+    ''' Consecutive movements of the same face / axis are fused. '''
+    assert _compile_alg(alg).tolist() == [MOVE_CODES[m] for m in expected]
+
+@pytest.mark.parametrize('face', ['b', 'd', 'f', 'l', 'r', 'u'])
+@pytest.mark.parametrize('suffix', ['', '\'', '2'])
+def test_compile_alg_wide_turns(face: str, suffix: str) -> None:
+    ''' 3x3x3 wide turns turn the face and the middle layer together. '''
+    cube: Cube = Cube(3)
+    pcs: list[Cube_Piece] = cube.pcs
+    cube.apply_sequence(_compile_alg(f'{face}{suffix}'))
+    side: int = 1 if face in 'fru' else -1
+    _reference_rotate(pcs, (0, side), f'{face.upper()}{suffix}')
+    assert _snapshot(cube.pcs) == _snapshot(pcs)
+
+def test_compiled_formulae_are_read_only() -> None:
+    ''' The compiled `MOVES` formulae are shared, so they are read-only. '''
+    for codes in ALG_TABLE.values():
+        assert not codes.flags.writeable
+
+# =================
+# 3x3x3 Piece State
+def test_cube3state_matches_cube() -> None:
+    ''' `Cube3State` face turns match `Cube.rotate()`. '''
+    rng: random.Random = random.Random(3)
+    for _ in range(10):
+        codes: list[int] = rng.choices(range(18), k=NUM_MOVES)
+        cube: Cube = Cube(3)
+        for code in codes:
+            cube.rotate(MOVE_NAMES[code])
+
+        state: Cube3State = Cube3State()
+        state.apply_sequence(np.array(codes))
+        assert state.to_cube().state_key() == cube.state_key()
+        assert Cube3State.from_cube(cube).state_key() == state.state_key()
+
+        state = Cube3State()
+        state.apply(' '.join(MOVE_NAMES[code] for code in codes))
+        assert state.to_cube().state_key() == cube.state_key()
+
+def test_cube3state_single_turns() -> None:
+    ''' Each face turn only moves its own lanes, and 4 turns are solved. '''
+    for code in range(18):
+        state: Cube3State = Cube3State()
+        state.apply_sequence([code])
+        assert not state.is_solved()
+        cube: Cube = Cube(3)
+        cube.rotate(MOVE_NAMES[code])
+        assert state.to_cube().state_key() == cube.state_key()
+        state.apply_sequence([code] * 3)
+        assert state.is_solved()
+
+# ==================
+# Copies / Templates
+@pytest.mark.parametrize('size', SIZES)
+def test_copies_keep_size_and_state(size: int) -> None:
+    ''' Clones, copies and pickles keep the class, size and colours. '''
+    cube: Cube = Cube(size)
+    cube.rotate('R')
+    layout: str = cube.layout_front
+    for other in [
+            cube.clone(),
+            copy.copy(cube),
+            copy.deepcopy(cube),
+            pickle.loads(pickle.dumps(cube)),
+    ]:
+        assert type(other) is (Cube3 if size == 3 else Cube)
+        assert other.size == size
+        assert other.state_key() == cube.state_key()
+        other.rotate('U')
+        assert other.layout_front != layout
+        assert cube.layout_front == layout
+
+@pytest.mark.parametrize('size', SIZES)
+def test_shared_tables_are_read_only(size: int) -> None:
+    ''' Cubes of the same size share read-only tables. '''
+    cube: Cube = Cube(size)
+    other: Cube = Cube(size)
+    assert cube.pos is other.pos
+    for table in [
+            cube.pos,
+            cube._lattice,
+            cube._slots,
+            cube._move_codes,
+            *cube._face_idx.values(),
+            *cube._moves.values(),
+    ]:
+        assert not table.flags.writeable
+    cube.coord_vals.append(99)
+    assert 99 not in other.coord_vals
+    assert 99 not in Cube(size).coord_vals
+
+
+# =============================================================================
+# End of File
+# =============================================================================